@@ -65,12 +65,62 @@ Repository: https://github.com/Gnol86/FullAutomationLight
 
 import appdaemon.plugins.hass.hassapi as hass # type: ignore
 
+class Room:
+    """
+    Configuration and state of a room.
+    Attributes are stored in slots to keep rooms small and fast to access.
+    """
+
+    __slots__ = ('lights_entity', 'lights_obj', 'occupancy_entity', 'occupancy',
+                 'luminance_entity', 'low_light', 'luminance_limit', 'luminance_hysteresis',
+                 'hight_luminance_off_light', 'occupancy_off_delay', 'is_light_on',
+                 'scenes', 'natural_lighting', '_force_scenes', '_last_dispatch',
+                 '_luminance_limit_int', '_luminance_hyst_int', '_has_hysteresis')
+
+    # Attributes that can be set from apps.yaml
+    CONFIG_KEYS = ('lights_entity', 'occupancy_entity', 'occupancy_off_delay',
+                   'luminance_entity', 'luminance_limit', 'luminance_hysteresis',
+                   'hight_luminance_off_light')
+
+    def __init__(self, defaults, config):
+        """
+        Build a room from default values and its apps.yaml configuration.
+        Only the keys of CONFIG_KEYS are read from the configuration.
+        
+        Args:
+            defaults (dict): Default values of the configuration keys
+            config (dict): Room configuration from apps.yaml
+        """
+        for key in self.CONFIG_KEYS:
+            setattr(self, key, config.get(key, defaults.get(key)))
+        # Runtime state, never taken from the configuration
+        self.lights_obj = None
+        self.occupancy = True
+        self.low_light = True
+        self.is_light_on = False
+        self.scenes = []
+        self.natural_lighting = []
+        self._force_scenes = []
+        self._last_dispatch = None
+        self._luminance_limit_int = 0
+        self._luminance_hyst_int = 0
+        self._has_hysteresis = False
+
+    def __repr__(self):
+        return "Room({})".format({slot: getattr(self, slot) for slot in self.__slots__})
+
+
 class FullAutomationLight(hass.Hass):
     """
     Main class for handling automated light control in Home Assistant.
     Inherits from AppDaemon's Hass class.
     """
 
+    # States considered as an occupied room
+    _OCCUPIED_STATES = frozenset(("on", "home", True, "true", "True"))
+    # States for which no numeric value is available
+    _BAD_STATES = frozenset(("unknown", "unavailable"))
+
     def initialize(self):
         """
         Initialize the automation system.
@@ -84,7 +134,8 @@ class FullAutomationLight(hass.Hass):
         self.log("")
 
         # init
-        self.entities = []
+        self.entities = set()
+        self.sun_elevation_handle = None
         self.natural_lighting = self.init_natural_lighting()
         self.transitions = self.init_transitions()
         self.rooms = self.init_rooms()
@@ -96,15 +147,29 @@ class FullAutomationLight(hass.Hass):
 
     def add_entity(self, entity):
         """
-        Add an entity to the tracking list if not already present.
+        Add an entity to the tracking set.
         
         Args:
             entity (str): The entity_id to add to tracking
         """
-        if not entity in self.entities:
-            self.entities.append(entity)
+        self.entities.add(entity)
 
-    def set_light(self, room_name, trigger):
+    def _get_state_cached(self, entity, _cache):
+        """
+        Get the state of an entity, fetching it at most once per event.
+        
+        Args:
+            entity (str): The entity_id to read
+            _cache (dict): Per-event cache of already fetched states
+            
+        Returns:
+            The state of the entity
+        """
+        if entity not in _cache:
+            _cache[entity] = self.get_state(entity)
+        return _cache[entity]
+
+    def set_light(self, room_name, trigger, state_cache=None):
         """
         Control light state based on room settings and trigger type.
         
@@ -112,71 +177,105 @@ class FullAutomationLight(hass.Hass):
             room_name (str): Name of the room to control
             trigger (str): Event that triggered the light change 
                          ('occupancy', 'scene', 'natural_lighting', etc.)
+            state_cache (dict): Optional per-event cache of entity states
         """
+        if state_cache is None:
+            state_cache = {}
         transition = self.transitions.get(trigger, 1)
-        self.debug_log("{}: {} ({})".format(room_name, trigger, transition))
+        self.debug_log("%s: %s (%s)", room_name, trigger, transition)
 
         room = self.rooms[room_name]
         mode = ""
 
-        if room['is_light_on']:
-            if 'scenes' in room:
-                for scene in room['scenes']:
-                    if self.get_state(scene['scene_trigger_entity']) == scene['scene_trigger_value']:
+        if room.is_light_on:
+            if room.scenes:
+                for scene in room.scenes:
+                    if self._get_state_cached(scene['scene_trigger_entity'], state_cache) == scene['scene_trigger_value']:
                         mode = "scene"
-                        entity = self.get_entity(scene['scene_entity'])
-                        domain = scene['scene_entity'].split('.')[0]
-                        if domain == "script" or transition == None:
+                        dispatch = (True, mode, scene['scene_entity'])
+                        if self.is_dispatched(room, dispatch):
+                            break
+                        entity = scene['_entity_obj']
+                        if scene['_skip_transition'] or transition is None:
                             entity.call_service("turn_on")
                         else:
                             entity.call_service(
                                 "turn_on", transition=transition)
-                        self.debug_log(
-                            "ON - Scene : {}".format(scene['scene_entity']))
+                        room._last_dispatch = dispatch
+                        self.debug_log("ON - Scene : %s", scene['scene_entity'])
                         break
-            if mode == "" and self.natural_lighting and 'natural_lighting' in room:
-                for natural_lighting in room['natural_lighting']:
+            if mode == "" and self.natural_lighting and room.natural_lighting:
+                modes = self.natural_lighting['modes']
+                # One call per light, the last entry targeting a light wins
+                pending = {}
+                for natural_lighting in room.natural_lighting:
                     mode = 'natural_lighting'
-                    brightness = self.natural_lighting['modes'][natural_lighting['name']]['brightness']
-                    kelvin = self.natural_lighting['modes'][natural_lighting['name']]['kelvin']
-                    entity = self.get_entity(
-                        natural_lighting['lights_entity']) if 'lights_entity' in natural_lighting else self.get_entity(room['lights_entity'])
+                    nl_mode = modes[natural_lighting['name']]
+                    brightness = nl_mode['brightness']
+                    kelvin = nl_mode['kelvin']
                     if natural_lighting['boost_brightness_pct'] != 0:
-                        brightness = int(
-                            brightness + (brightness / 100 * natural_lighting['boost_brightness_pct']))
-                        brightness = 255 if brightness > 255 else brightness
-                        brightness = 1 if brightness < 1 else brightness
+                        brightness = max(1, min(255, int(
+                            brightness + brightness / 100 * natural_lighting['boost_brightness_pct'])))
+                    pending[natural_lighting.get('lights_entity', room.lights_entity)] = (
+                        natural_lighting['_entity_obj'], brightness, kelvin)
+                dispatch = (True, mode, tuple((entity_id, brightness, kelvin)
+                                              for entity_id, (_, brightness, kelvin) in pending.items()))
+                if not self.is_dispatched(room, dispatch):
+                    for entity, brightness, kelvin in pending.values():
+                        if transition == None:
+                            entity.call_service(
+                                "turn_on", brightness=brightness, kelvin=kelvin)
+                        else:
+                            entity.call_service(
+                                "turn_on", brightness=brightness, kelvin=kelvin, transition=transition)
+                    room._last_dispatch = dispatch
+                    self.debug_log("ON - Natural lighting")
+            if mode == "":
+                dispatch = (True, mode)
+                if not self.is_dispatched(room, dispatch):
+                    entity = room.lights_obj
                     if transition == None:
-                        entity.call_service(
-                            "turn_on", brightness=brightness, kelvin=kelvin)
+                        entity.call_service("turn_on")
                     else:
-                        entity.call_service(
-                            "turn_on", brightness=brightness, kelvin=kelvin, transition=transition)
-                self.debug_log("ON - Natural lighting")
-            if mode == "":
-                entity = self.get_entity(room['lights_entity'])
-                if transition == None:
-                    entity.call_service("turn_on")
-                else:
-                    entity.call_service("turn_on", transition=transition)
-                self.debug_log("ON")
+                        entity.call_service("turn_on", transition=transition)
+                    room._last_dispatch = dispatch
+                    self.debug_log("ON")
         else:
-            self.debug_log("OFF")
-            entity = self.get_entity(room['lights_entity'])
-            if self.transitions['off'] == None:
-                entity.call_service("turn_off")
-            else:
-                entity.call_service(
-                    "turn_off", transition=self.transitions['off'])
+            dispatch = (False,)
+            if not self.is_dispatched(room, dispatch):
+                self.debug_log("OFF")
+                entity = room.lights_obj
+                if self.transitions['off'] == None:
+                    entity.call_service("turn_off")
+                else:
+                    entity.call_service(
+                        "turn_off", transition=self.transitions['off'])
+                room._last_dispatch = dispatch
         self.debug_log("")
 
+    def is_dispatched(self, room, dispatch):
+        """
+        Check if the lights of a room are already in the requested state.
+        
+        Args:
+            room (Room): Room configuration
+            dispatch (tuple): Requested state (is_light_on, mode, parameters)
+            
+        Returns:
+            bool: True if the same state was the last one sent to the room
+        """
+        if room._last_dispatch == dispatch:
+            self.debug_log("Unchanged")
+            return True
+        return False
+
     def init_rooms(self):
         """
         Initialize room configurations from the apps.yaml settings.
         Sets up default values and validates room configurations.
         
         Returns:
-            dict: Dictionary of room configurations
+            dict: Dictionary of Room configurations
         """
         self.debug_log("Init Rooms...")
         default_room = {
@@ -186,83 +285,125 @@ class FullAutomationLight(hass.Hass):
             "luminance_entity": False,
             "luminance_limit": 10,
             "luminance_hysteresis": 0,
-            "hight_luminance_off_light": False,
-            "occupancy": True,
-            "low_light": True,
-            "is_light_on": False
-        }
-        default_natural_lighting = {
-            "name": "default",
-            "boost_brightness_pct": 0
+            "hight_luminance_off_light": False
         }
         rooms = {}
         if 'rooms' in self.args:
             for name in self.args['rooms']:
-                rooms[name] = default_room.copy()
-                rooms[name].update({k: v for k, v in self.args['rooms'][name].items(
+                room_args = self.args['rooms'][name]
+                rooms[name] = Room(default_room, {k: v for k, v in room_args.items(
                 ) if k not in ['natural_lighting', 'scenes']})
-                if not rooms[name]['lights_entity'] or not self.get_entity(rooms[name]['lights_entity']).exists():
+                lights_entity_obj = self.get_entity(
+                    rooms[name].lights_entity) if rooms[name].lights_entity else None
+                if lights_entity_obj is None or not lights_entity_obj.exists():
                     self.log(f"'{name}' : 'lights_entity' not exists !!!")
                     del rooms[name]
                     continue
-                self.add_entity(rooms[name]['lights_entity'])
-
-                if 'natural_lighting' in self.args['rooms'][name]:
-                    rooms[name]['natural_lighting'] = []
-                    if type(self.args['rooms'][name]['natural_lighting']) == list:
-                        nb = 0
-                        for natural_lighting in self.args['rooms'][name]['natural_lighting']:
-                            rooms[name]['natural_lighting'].append(
-                                default_natural_lighting.copy())
-                            rooms[name]['natural_lighting'][nb].update(
-                                {k: v for k, v in natural_lighting.items()})
-                            if not rooms[name]['natural_lighting'][nb]['name'] in self.natural_lighting['modes']:
-                                rooms[name]['natural_lighting'][nb]['name'] = 'default'
-                            if 'natural_entity' in rooms[name]['natural_lighting'][nb]:
-                                self.add_entity(
-                                    rooms[name]['natural_lighting'][nb]['natural_entity'])
-                            else:
-                                rooms[name]['natural_lighting'][nb]['natural_entity'] = rooms[name]['lights_entity']
-
-                            nb += 1
-                    else:
-                        rooms[name]['natural_lighting'].append(
-                            default_natural_lighting.copy())
-                        rooms[name]['natural_lighting'][0]['natural_entity'] = rooms[name]['lights_entity']
-
-                if 'scenes' in self.args['rooms'][name] and type(self.args['rooms'][name]['scenes']) == list:
-                    rooms[name]['scenes'] = self.args['rooms'][name]['scenes']
-                    for scene in rooms[name]['scenes']:
-                        if ('scene_entity' in scene
-                                and self.get_entity(scene['scene_entity']).exists()
-                                and 'scene_trigger_entity' in scene
-                                and self.get_entity(scene['scene_trigger_entity']).exists()
-                                and 'scene_trigger_value' in scene
-                                and (scene['scene_entity'].split('.')[0] == "script" or scene['scene_entity'].split('.')[0] == "scene")
-                            ):
-                            self.listen_state(
-                                self.callback_room, scene['scene_trigger_entity'], new=scene['scene_trigger_value'], room_name=name, trigger="scene")
-                            self.listen_state(
-                                self.callback_room, scene['scene_trigger_entity'], old=scene['scene_trigger_value'], room_name=name, trigger="scene")
-
-                if rooms[name]['occupancy_entity'] and self.get_entity(rooms[name]['occupancy_entity']).exists():
-                    if rooms[name]['occupancy_off_delay'] > 0:
+                rooms[name].lights_obj = lights_entity_obj
+                self.add_entity(rooms[name].lights_entity)
+                rooms[name]._luminance_limit_int = self.int(rooms[name].luminance_limit)
+                rooms[name]._luminance_hyst_int = self.int(rooms[name].luminance_hysteresis)
+                rooms[name]._has_hysteresis = rooms[name]._luminance_hyst_int != 0
+
+                if 'natural_lighting' in room_args:
+                    rooms[name].natural_lighting = self._normalize_natural_lighting(
+                        rooms[name], room_args['natural_lighting'])
+
+                if 'scenes' in room_args and isinstance(room_args['scenes'], list):
+                    rooms[name].scenes = self._normalize_scenes(
+                        name, room_args['scenes'])
+                    rooms[name]._force_scenes = [
+                        scene for scene in rooms[name].scenes if scene['_force_light_on']]
+
+                if rooms[name].occupancy_entity and self.get_entity(rooms[name].occupancy_entity).exists():
+                    if rooms[name].occupancy_off_delay > 0:
                         self.listen_state(
-                            self.callback_room, rooms[name]['occupancy_entity'], new="on", room_name=name, trigger="occupancy")
-                        self.listen_state(self.callback_room, rooms[name]['occupancy_entity'], new="off",
-                                          duration=rooms[name]['occupancy_off_delay'], room_name=name, trigger="occupancy")
+                            self.callback_room, rooms[name].occupancy_entity, new="on", room_name=name, trigger="occupancy")
+                        self.listen_state(self.callback_room, rooms[name].occupancy_entity, new="off",
+                                          duration=rooms[name].occupancy_off_delay, room_name=name, trigger="occupancy")
                     else:
                         self.listen_state(
-                            self.callback_room, rooms[name]['occupancy_entity'], room_name=name, trigger="occupancy")
-                if rooms[name]['luminance_entity'] and self.get_entity(rooms[name]['luminance_entity']).exists():
+                            self.callback_room, rooms[name].occupancy_entity, room_name=name, trigger="occupancy")
+                if rooms[name].luminance_entity and self.get_entity(rooms[name].luminance_entity).exists():
                     self.listen_state(
-                        self.callback_room, rooms[name]['luminance_entity'], room_name=name, trigger="low_light")
+                        self.callback_room, rooms[name].luminance_entity, room_name=name, trigger="low_light")
 
         self.debug_log(rooms)
         self.debug_log("Rooms Initialized")
         self.debug_log("")
         return rooms
 
+    def _normalize_natural_lighting(self, room, cfg):
+        """
+        Build the natural lighting entries of a room from its configuration.
+        
+        Args:
+            room (Room): Room configuration, with its lights entity resolved
+            cfg (list|bool): 'natural_lighting' value of the room in apps.yaml
+            
+        Returns:
+            list: Natural lighting entries of the room
+        """
+        default_natural_lighting = {
+            "name": "default",
+            "boost_brightness_pct": 0
+        }
+        entries = []
+        if isinstance(cfg, list):
+            for natural_lighting in cfg:
+                entry = default_natural_lighting.copy()
+                entry.update({k: v for k, v in natural_lighting.items()})
+                if not entry['name'] in self.natural_lighting['modes']:
+                    entry['name'] = 'default'
+                if 'natural_entity' in entry:
+                    self.add_entity(entry['natural_entity'])
+                else:
+                    entry['natural_entity'] = room.lights_entity
+                entry['_entity_obj'] = self.get_entity(
+                    entry['lights_entity']) if 'lights_entity' in entry else room.lights_obj
+                entries.append(entry)
+        else:
+            entry = default_natural_lighting.copy()
+            entry['natural_entity'] = room.lights_entity
+            entry['_entity_obj'] = room.lights_obj
+            entries.append(entry)
+        return entries
+
+    def _normalize_scenes(self, name, cfg):
+        """
+        Validate the scenes of a room and listen to their triggers.
+        
+        Args:
+            name (str): Name of the room
+            cfg (list): 'scenes' value of the room in apps.yaml
+            
+        Returns:
+            list: Valid scenes of the room, in priority order
+        """
+        scenes = []
+        for scene in cfg:
+            # Check the configuration before querying the entities
+            if not ('scene_entity' in scene
+                    and 'scene_trigger_entity' in scene
+                    and 'scene_trigger_value' in scene
+                    and scene['scene_entity'].split('.', 1)[0] in ("script", "scene")):
+                continue
+            scene_entity_obj = self.get_entity(scene['scene_entity'])
+            if not scene_entity_obj.exists() or not self.get_entity(scene['scene_trigger_entity']).exists():
+                continue
+            # Resolve static scene fields once
+            scene = dict(scene)
+            scene['_domain'] = scene['scene_entity'].split('.', 1)[0]
+            scene['_force_light_on'] = bool(scene.get('scene_force_light_on', False))
+            scene['_skip_transition'] = scene['_domain'] == 'script'
+            scene['_entity_obj'] = scene_entity_obj
+            scenes.append(scene)
+            self.listen_state(
+                self.callback_room, scene['scene_trigger_entity'], new=scene['scene_trigger_value'], room_name=name, trigger="scene")
+            self.listen_state(
+                self.callback_room, scene['scene_trigger_entity'], old=scene['scene_trigger_value'], room_name=name, trigger="scene")
+        return scenes
+
     def callback_room(self, entity, attribute, old, new, kwargs):
         """
         Callback handler for room state changes (occupancy/luminance).
@@ -274,54 +415,56 @@ class FullAutomationLight(hass.Hass):
             new (str): New state value
             kwargs (dict): Additional callback arguments
         """
-        self.set_is_light_on(kwargs['room_name'], kwargs['trigger'])
+        # The new state is already known, no need to fetch it again
+        kwargs['_state_cache'] = {entity: new}
+        self.set_is_light_on(kwargs['room_name'], kwargs['trigger'], kwargs['_state_cache'])
 
-    def set_is_light_on(self, room_name, trigger):
+    def set_is_light_on(self, room_name, trigger, state_cache=None):
         """
         Determine if a room's lights should be on based on conditions.
         
         Args:
             room_name (str): Name of the room to evaluate
             trigger (str): Event that triggered the evaluation
+            state_cache (dict): Optional per-event cache of entity states
         """
-        if self.rooms[room_name]['occupancy_entity']:
-            self.rooms[room_name]['occupancy'] = True if self.get_state(
-                self.rooms[room_name]['occupancy_entity']) in ["on", "home", True, "true", "True"] else False
-
-        if self.rooms[room_name]['luminance_entity']:
-            luminance_limit = self.int(
-                self.rooms[room_name]['luminance_limit'])
-            if self.rooms[room_name]['low_light']:
-                luminance_limit += self.int(
-                    self.rooms[room_name]['luminance_hysteresis'])
-            else:
-                luminance_limit -= self.int(
-                    self.rooms[room_name]['luminance_hysteresis'])
-            self.rooms[room_name]['low_light'] = True if self.int(self.get_state(
-                self.rooms[room_name]['luminance_entity'])) <= luminance_limit else False
+        if state_cache is None:
+            state_cache = {}
+        room = self.rooms[room_name]
+        if room.occupancy_entity:
+            room.occupancy = self._get_state_cached(
+                room.occupancy_entity, state_cache) in self._OCCUPIED_STATES
+
+        if room.luminance_entity:
+            luminance_limit = room._luminance_limit_int
+            if room._has_hysteresis:
+                if room.low_light:
+                    luminance_limit += room._luminance_hyst_int
+                else:
+                    luminance_limit -= room._luminance_hyst_int
+            room.low_light = self.int(self._get_state_cached(
+                room.luminance_entity, state_cache)) <= luminance_limit
 
-        old_is_light_on = self.rooms[room_name]['is_light_on']
+        old_is_light_on = room.is_light_on
         
         # Vérifier si une scène avec force_light_on est active
         force_light_on = False
-        if 'scenes' in self.rooms[room_name]:
-            for scene in self.rooms[room_name]['scenes']:
-                if (self.get_state(scene['scene_trigger_entity']) == scene['scene_trigger_value'] and
-                    'scene_force_light_on' in scene and scene['scene_force_light_on']):
-                    force_light_on = True
-                    break
+        for scene in room._force_scenes:
+            if self._get_state_cached(scene['scene_trigger_entity'], state_cache) == scene['scene_trigger_value']:
+                force_light_on = True
+                break
         
         if force_light_on:
-            self.rooms[room_name]['is_light_on'] = True
-        elif not (self.rooms[room_name]['is_light_on'] and not self.rooms[room_name]['low_light']) or self.rooms[room_name]['hight_luminance_off_light'] or trigger == 'occupancy':
-            self.rooms[room_name]['is_light_on'] = self.rooms[room_name]['occupancy'] and self.rooms[room_name]['low_light']
+            room.is_light_on = True
+        elif not (room.is_light_on and not room.low_light) or room.hight_luminance_off_light or trigger == 'occupancy':
+            room.is_light_on = room.occupancy and room.low_light
 
-        if trigger in ["init", "scene", "natural_lighting"] or old_is_light_on != self.rooms[room_name]['is_light_on']:
+        if trigger in ["init", "scene", "natural_lighting"] or old_is_light_on != room.is_light_on:
             # Si force_light_on est actif et que les lumières étaient éteintes, on utilise la transition occupancy
             if force_light_on and trigger == "scene" and not old_is_light_on:
-                self.set_light(room_name, "occupancy")
+                self.set_light(room_name, "occupancy", state_cache)
             else:
-                self.set_light(room_name, trigger)
+                self.set_light(room_name, trigger, state_cache)
 
     def init_transitions(self):
         """
@@ -389,7 +532,7 @@ class FullAutomationLight(hass.Hass):
         if 'modes' in nl_args:
             modes = nl_args['modes']
             # Check if modes is a list
-            if type(modes) == list:
+            if isinstance(modes, list):
                 # Loop through modes and update the default values
                 for mode in modes:
                     natural_lighting['modes'][mode['name']
@@ -412,7 +555,7 @@ class FullAutomationLight(hass.Hass):
         # Listen to changes in sun elevation state
         self.listen_state(self.callback_sun_elevation,
                           sun_entity, attribute='elevation')
-        self.debug_log(f"Listen state of {sun_entity}")
+        self.debug_log("Listen state of %s", sun_entity)
 
         # Set natural lighting
         natural_lighting = self.set_natural_lighting(natural_lighting)
@@ -433,11 +576,36 @@ class FullAutomationLight(hass.Hass):
             new (str): New elevation value
             kwargs (dict): Additional callback arguments
         """
-        self.natural_lighting['sun_elevation'] = self.int(new)
+        new_elev = self.int(new)
+        # Coalesce bursts of elevation updates into a single recompute
+        if self.sun_elevation_handle is not None:
+            self.cancel_timer(self.sun_elevation_handle)
+            self.sun_elevation_handle = None
+        if new_elev == self.natural_lighting['sun_elevation']:
+            return
+        self.sun_elevation_handle = self.run_in(
+            self.apply_natural_lighting, 2, elev=new_elev)
+
+    def apply_natural_lighting(self, kwargs):
+        """
+        Apply a new sun elevation to natural lighting and refresh the rooms.
+        
+        Args:
+            kwargs (dict): Scheduler arguments, 'elev' holds the new elevation
+        """
+        self.sun_elevation_handle = None
+        self.natural_lighting['sun_elevation'] = kwargs['elev']
+        # Only refresh the rooms if a mode's brightness or kelvin changed
+        previous = {name: (mode['brightness'], mode['kelvin'])
+                    for name, mode in self.natural_lighting['modes'].items()}
         self.natural_lighting = self.set_natural_lighting(
             self.natural_lighting)
-        for room_name in self.rooms:
-            if 'natural_lighting' in self.rooms[room_name] and self.rooms[room_name]['natural_lighting'] and self.rooms[room_name]['is_light_on']:
+        if all(previous[name] == (mode['brightness'], mode['kelvin'])
+               for name, mode in self.natural_lighting['modes'].items()):
+            self.debug_log("Natural lighting unchanged")
+            return
+        for room_name, room in self.rooms.items():
+            if room.natural_lighting and room.is_light_on:
                 self.set_light(room_name, "natural_lighting")
 
     def set_natural_lighting(self, natural_lighting):
@@ -451,41 +619,38 @@ class FullAutomationLight(hass.Hass):
             dict: Updated natural lighting settings
         """
         self.debug_log("---")
-        self.debug_log(f"Sun elevation: {natural_lighting['sun_elevation']}")
-        for name in natural_lighting['modes']:
-            mode = natural_lighting['modes'][name]
-            # Calculate the brightness value based on the sun elevation
-            mode['brightness'] = self.scale(
-                natural_lighting['sun_elevation'],
-                (natural_lighting['min_elevation_for_brightness'],
-                 natural_lighting['max_elevation_for_brightness']),
-                (mode['min_brightness'], mode['max_brightness'])
-            )
-            # Calculate the kelvin value based on the sun elevation
-            mode['kelvin'] = self.scale(
-                natural_lighting['sun_elevation'],
-                (natural_lighting['min_elevation_for_kelvin'],
-                 natural_lighting['max_elevation_for_kelvin']),
-                (mode['min_kelvin'], mode['max_kelvin'])
-            )
-            self.debug_log(
-                f"{name} - brightness: {mode['brightness']} - kelvin: {mode['kelvin']}")
+        self.debug_log("Sun elevation: %s", natural_lighting['sun_elevation'])
+        # The clamped elevation ratio is shared by all modes, each mode only scales it
+        brightness_ratio = self.ratio(
+            natural_lighting['sun_elevation'],
+            (natural_lighting['min_elevation_for_brightness'],
+             natural_lighting['max_elevation_for_brightness']))
+        kelvin_ratio = self.ratio(
+            natural_lighting['sun_elevation'],
+            (natural_lighting['min_elevation_for_kelvin'],
+             natural_lighting['max_elevation_for_kelvin']))
+        for name, mode in natural_lighting['modes'].items():
+            mode['brightness'] = int(brightness_ratio * (
+                mode['max_brightness'] - mode['min_brightness']) + mode['min_brightness'])
+            mode['kelvin'] = int(kelvin_ratio * (
+                mode['max_kelvin'] - mode['min_kelvin']) + mode['min_kelvin'])
+            self.debug_log("%s - brightness: %s - kelvin: %s",
+                           name, mode['brightness'], mode['kelvin'])
         self.debug_log("---")
         return natural_lighting
 
-    def scale(self, val, src, dst):
+    def ratio(self, val, src):
         """
-        Scale a value from one range to another.
+        Clamp a value to a range and return its position within the range.
         
         Args:
-            val (float): Value to scale
+            val (float): Value to clamp
             src (tuple): Source range (min, max)
-            dst (tuple): Destination range (min, max)
             
         Returns:
-            int: Scaled value
+            float: Position of the clamped value, from 0 (min) to 1 (max)
         """
-        return self.int((min(max(val, src[0]), src[1]) - src[0]) / (src[1]-src[0]) * (dst[1]-dst[0]) + dst[0])
+        return (min(max(val, src[0]), src[1]) - src[0]) / (src[1] - src[0])
 
     def int(self, val):
         """
@@ -497,19 +662,26 @@ class FullAutomationLight(hass.Hass):
         Returns:
             int: Converted value, 0 if conversion fails
         """
-        if val in ['unknown', 'unavailable']:
+        if isinstance(val, int):
+            return val
+        if val in self._BAD_STATES:
             return 0
         try:
             return int(float(val))
         except:
             return val
 
-    def debug_log(self, message):
+    def debug_log(self, fmt, *args):
         """
         Log debug messages if debug mode is enabled.
+        The message is only formatted when it is logged.
         
         Args:
-            message (str): Message to log
+            fmt (str|callable): Message to log, a %-format string when args
+                                are given, or a callable returning the message
+            *args: Values to format into the message
         """
         if self.debug:
-            self.log(message)
+            if callable(fmt):
+                fmt = fmt()
+            self.log(fmt % args if args else fmt)